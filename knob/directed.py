@@ -15,6 +15,8 @@ from knob.misc import AttrTypes, attrs_repr
 class Element:
     """A graph's element (node/edge)"""
 
+    __slots__ = ("attrs", "id")
+
     # The next ID to assign to a created element
     __NEXT_ID = 0
 
@@ -34,9 +36,6 @@ class Element:
         self.id = Element.__NEXT_ID
         Element.__NEXT_ID += 1
 
-    def __hash__(self):
-        return id(self)
-
     def ref_repr(self):
         """Format a reference representation of the element"""
         return f"#{self.id}"
@@ -60,13 +59,15 @@ class Element:
             False, if not.
         """
         if isinstance(element, type(self)):
-            return set(self.attrs.items()) <= set(element.attrs.items())
+            return self.attrs.items() <= element.attrs.items()
         raise NotImplementedError
 
 
 class Node(Element):
     """A graph's node"""
 
+    __slots__ = ()
+
     def __copy__(self):
         return Node(**self.attrs)
 
@@ -78,6 +79,8 @@ class Node(Element):
 class Edge(Element):
     """A directed graph's edge"""
 
+    __slots__ = ("source", "target")
+
     def __init__(self, source: Node, target: Node, **attrs: AttrTypes):
         """
         Initialize a graph's edge.
@@ -463,6 +466,28 @@ class Graph:
         other_nodes = set(other.get_nodes())
         other_edges = set(other.get_edges())
 
+        def index_incident_edges(nodes: set[Node], edges: set[Edge]) -> \
+                Dict[Node, set[Edge]]:
+            """Map each node to the set of edges incident to it"""
+            nodes_edges: Dict[Node, set[Edge]] = {
+                node: set() for node in nodes
+            }
+            for edge in edges:
+                nodes_edges[edge.source].add(edge)
+                nodes_edges[edge.target].add(edge)
+            return nodes_edges
+
+        # Index incident edges once, instead of scanning all the elements
+        # for every node visited while matching
+        self_incident_edges = index_incident_edges(self_nodes, self_edges)
+        other_incident_edges = index_incident_edges(other_nodes, other_edges)
+        # Find the candidate nodes of the other graph, matching each node of
+        # this graph, once, instead of re-matching them for every subgraph
+        self_node_candidates = {
+            self_node: set(filter(self_node.matches, other_nodes))
+            for self_node in self_nodes
+        }
+
         def match_components(
             matches: Dict[Elements, Elements],
             self_node: Node,
@@ -515,8 +540,7 @@ class Graph:
             # print_stack_indented(f"match_components"
             #                      f"{(matches, self_node, other_node)}")
 
-            rem_self_edges = \
-                self.get_incident_edges(self_node) - self_matches
+            rem_self_edges = self_incident_edges[self_node] - self_matches
 
             # If there are no edges left to match
             if not rem_self_edges:
@@ -524,8 +548,7 @@ class Graph:
                 yield matches
                 return
 
-            rem_other_edges = \
-                other.get_incident_edges(other_node) - other_matches
+            rem_other_edges = other_incident_edges[other_node] - other_matches
 
             # For every combination of self and other edges
             for self_edge in rem_self_edges:
@@ -610,12 +633,10 @@ class Graph:
                 yield matches
                 return
             rem_self_nodes = self_nodes - self_matches
-            rem_other_nodes = other_nodes - other_matches
             for self_node in rem_self_nodes:
-                for other_node in rem_other_nodes:
-                    # If the nodes don't match
-                    if not self_node.matches(other_node):
-                        continue
+                # For each remaining matching node
+                for other_node in \
+                        self_node_candidates[self_node] - other_matches:
                     # For each component match
                     for new_matches in match_components(
                         matches | {self_node: other_node},
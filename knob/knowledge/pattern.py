@@ -2,7 +2,11 @@
 KNOB - The knowledge graph pattern
 """
 
-from typing import Optional, Self, cast
+from typing import Optional, Self
+from types import MappingProxyType
+from operator import itemgetter
+import functools
+import itertools
 from knob.misc import AttrTypes, attrs_repr
 from knob import directed
 
@@ -14,6 +18,8 @@ from knob import directed
 class Element:
     """An abstract element (node or edge) pattern"""
 
+    __slots__ = ("attrs",)
+
     # The tuple of the names of implicit attributes in order of nesting
     IMPLICIT_ATTRS: tuple[str, ...] = ("_type",)
 
@@ -42,7 +48,32 @@ class Element:
         if not self.are_attrs_valid(attrs):
             raise ValueError
 
-        self.attrs = attrs
+        # Read-only, so the dictionary can be shared between patterns
+        self.attrs: MappingProxyType[str, AttrTypes] = \
+            MappingProxyType(attrs)
+
+    @classmethod
+    def _new(cls, attrs: dict[str, AttrTypes] |
+             MappingProxyType[str, AttrTypes]) -> Self:
+        """
+        Create an element pattern from attributes known to be valid, skipping
+        implicit attribute substitution and validation.
+
+        Args:
+            attrs:  The (valid) attribute dictionary, or a read-only
+                    view of one to share.
+
+        Returns:
+            The created pattern.
+        """
+        element = object.__new__(cls)
+        element.attrs = attrs if isinstance(attrs, MappingProxyType) \
+            else MappingProxyType(attrs)
+        return element
+
+    def __reduce__(self):
+        # The read-only attribute view can't be pickled, rebuild from a dict
+        return self._new, (dict(self.attrs),)
 
     def with_updated_attrs(self, attrs: dict[str, AttrTypes]) -> Self:
         """
@@ -58,39 +89,50 @@ class Element:
 
     def attrs_repr(self):
         """Generate a string representation of element attributes"""
-        result = ""
-        explicit_attrs = self.attrs.copy()
+        parts = []
+        # The number of (nested) implicit attributes present
+        implicit_num = 0
         for implicit_attr in self.IMPLICIT_ATTRS:
-            if implicit_attr not in explicit_attrs:
+            if implicit_attr not in self.attrs:
                 break
-            value = explicit_attrs.pop(implicit_attr)
+            implicit_num += 1
+            value = self.attrs[implicit_attr]
             if value.isidentifier():
-                result += f".{value}"
+                parts.append(f".{value}")
             else:
-                result += f"[{value!r}]"
-        if explicit_attrs:
-            result += attrs_repr(explicit_attrs)
-        return result
+                parts.append(f"[{value!r}]")
+        # If there are only implicit attributes (the common case)
+        if len(self.attrs) == implicit_num:
+            return "".join(parts)
+        implicit_attrs = self.IMPLICIT_ATTRS[:implicit_num]
+        parts.append(attrs_repr({
+            k: v for k, v in self.attrs.items() if k not in implicit_attrs
+        }))
+        return "".join(parts)
 
     def __repr__(self):
-        return self.__class__.__name__ + self.attrs_repr()
+        return f"{self.__class__.__name__}{self.attrs_repr()}"
 
 
 class Node(Element):
     """A node pattern"""
 
+    __slots__ = ()
+
     def __or__(self, other) -> Self:
         """Merge two instances of the pattern together"""
         if other is self:
             return self
         if not isinstance(other, type(self)):
             return NotImplemented
-        return type(self)(self.attrs | other.attrs)
+        return self._new(self.attrs | other.attrs)
 
 
 class Entity(Node):
     """An entity pattern"""
 
+    __slots__ = ()
+
     # The tuple of the names of implicit attributes in order of nesting
     IMPLICIT_ATTRS: tuple[str, ...] = Node.IMPLICIT_ATTRS + ("_name",)
 
@@ -98,10 +140,14 @@ class Entity(Node):
 class Relation(Node):
     """A relation pattern"""
 
+    __slots__ = ()
+
 
 class Edge(Element):
     """An edge pattern"""
 
+    __slots__ = ("source", "target")
+
     def __init__(self, attrs: dict[str, AttrTypes],
                  source: int = 0, target: int = 0):
         """
@@ -116,14 +162,35 @@ class Edge(Element):
         self.source = source
         self.target = target
 
+    @classmethod
+    def _new(cls, attrs: dict[str, AttrTypes] |
+             MappingProxyType[str, AttrTypes],
+             source: int = 0, target: int = 0) -> Self:
+        """
+        Create an edge pattern from attributes known to be valid, skipping
+        implicit attribute substitution and validation.
+
+        Args:
+            attrs:  The (valid) attribute dictionary, or a read-only
+                    view of one to share.
+            source: The ID of the source node, or zero if none.
+            target: The ID of the target node, or zero if none.
+
+        Returns:
+            The created pattern.
+        """
+        edge = super()._new(attrs)
+        edge.source = source
+        edge.target = target
+        return edge
+
+    def __reduce__(self):
+        return self._new, (dict(self.attrs), self.source, self.target)
+
     def __repr__(self):
-        return super().__repr__() + (
-            "[" +
-            (f"#{self.source}" if self.source else "") +
-            "->" +
-            (f"#{self.target}" if self.target else "") +
-            "]"
-        )
+        source = f"#{self.source}" if self.source else ""
+        target = f"#{self.target}" if self.target else ""
+        return f"{super().__repr__()}[{source}->{target}]"
 
     def with_updated_endpoints(
         self, source: int = 0, target: int = 0
@@ -138,7 +205,7 @@ class Edge(Element):
         Returns:
             The updated pattern.
         """
-        return type(self)(
+        return self._new(
             self.attrs,
             source or self.source,
             target or self.target
@@ -150,7 +217,7 @@ class Edge(Element):
             return self
         if not isinstance(other, type(self)):
             return NotImplemented
-        return type(self)(
+        return self._new(
             self.attrs | other.attrs,
             other.source or self.source,
             other.target or self.target
@@ -160,6 +227,9 @@ class Edge(Element):
 class Function(Edge):
     """A function edge pattern"""
 
+    # The function's type name (the "_type" attribute), or None for none
+    __slots__ = ("type",)
+
     @classmethod
     def are_attrs_valid(cls, attrs: dict[str, AttrTypes]):
         """Check if attributes dictionary is valid for a function"""
@@ -182,16 +252,33 @@ class Function(Edge):
         """
         assert isinstance(attrs, dict)
         super().__init__(attrs, source, target)
+        self.type: Optional[AttrTypes] = self.attrs.get("_type")
+
+    @classmethod
+    def _new(cls, attrs: dict[str, AttrTypes] |
+             MappingProxyType[str, AttrTypes],
+             source: int = 0, target: int = 0) -> Self:
+        """
+        Create a function pattern from attributes known to be valid, skipping
+        implicit attribute substitution and validation.
+
+        Args:
+            attrs:  The (valid) attribute dictionary, or a read-only
+                    view of one to share.
+            source: The ID of the source relation, or zero if none.
+            target: The ID of the target node, or zero if none.
+
+        Returns:
+            The created pattern.
+        """
+        function = super()._new(attrs, source, target)
+        function.type = function.attrs.get("_type")
+        return function
 
     def __repr__(self):
-        return self.__class__.__name__ + "." + (
-            repr(self.attrs.get("_type")) +
-            "[" +
-            (f"#{self.source}" if self.source else "") +
-            "->" +
-            (f"#{self.target}" if self.target else "") +
-            "]"
-        )
+        source = f"#{self.source}" if self.source else ""
+        target = f"#{self.target}" if self.target else ""
+        return f"{self.__class__.__name__}.{self.type!r}[{source}->{target}]"
 
     def is_complete(self):
         """
@@ -201,7 +288,7 @@ class Function(Edge):
         Returns:
             True if the function is complete, False otherwise.
         """
-        return self.source and self.target and "_type" in self.attrs
+        return self.source and self.target and self.type is not None
 
 
 # Element pattern types operated by the graph pattern
@@ -212,6 +299,11 @@ GraphElements = Entity | Relation | Function
 class Graph:
     """A graph pattern"""
 
+    __slots__ = ("elements", "marked", "left", "right", "_repr")
+
+    # Element IDs are non-zero integers: odd IDs are dynamic (renumbered on
+    # overlay), and even IDs are static (kept as is)
+
     # Next available static ID
     __NEXT_STATIC_ID = 2
 
@@ -220,18 +312,6 @@ class Graph:
         """Check if an element ID is valid (a non-zero integer)"""
         return isinstance(id, int) and bool(id)
 
-    @classmethod
-    def is_dynamic_id(cls, id):
-        """Check if an element ID is dynamic (odd)"""
-        assert cls.is_valid_id(id)
-        return bool(id & 1)
-
-    @classmethod
-    def is_static_id(cls, id):
-        """Check if an element ID is static (even)"""
-        assert cls.is_valid_id(id)
-        return not id & 1
-
     def __init__(self,
                  elements: dict[int, GraphElements],
                  marked: dict[int, bool],
@@ -261,25 +341,63 @@ class Graph:
         assert isinstance(elements, dict)
         assert self.is_valid_id(left)
         assert self.is_valid_id(right)
-        assert all(
-            self.is_valid_id(id) and isinstance(e, GRAPH_ELEMENTS)
-            for id, e in elements.items()
-        )
+        # Check elements in one pass, only if asserts are enabled
+        if __debug__:
+            for id, e in elements.items():
+                assert self.is_valid_id(id) and isinstance(e, GRAPH_ELEMENTS)
+                assert not isinstance(e, Function) or (
+                    (not e.source or
+                     isinstance(elements.get(e.source), Relation)) and
+                    (not e.target or
+                     isinstance(elements.get(e.target), Node))
+                ), "A function references an unknown node"
         assert isinstance(marked, dict)
-        assert set(marked) <= set(elements)
+        assert marked.keys() <= elements.keys()
         assert all(isinstance(m, bool) for m in marked.values())
-        assert all(
-            (not e.source or isinstance(elements.get(e.source), Relation)) and
-            (not e.target or isinstance(elements.get(e.target), Node))
-            for e in elements.values() if isinstance(e, Function)
-        ), "A function references an unknown node"
 
         self.elements = elements
         self.marked = marked
         self.left = left
         self.right = right
+        # The cached representation, or None if not generated yet
+        self._repr: Optional[str] = None
+
+    @staticmethod
+    def _new(elements: dict[int, GraphElements],
+             marked: dict[int, bool],
+             left: int, right: int) -> 'Graph':
+        """
+        Create a graph pattern from arguments known to be valid, skipping
+        validation. To be used for patterns derived from an existing one
+        without changing its elements' IDs, types, or endpoints.
+
+        Args:
+            elements:   A dictionary of element IDs and corresponding element
+                        patterns.
+            marked:     A dictionary of elements and their marked status.
+            left:       The ID of the left-side element pattern.
+            right:      The ID of the right-side element pattern.
+
+        Returns:
+            The created graph pattern.
+        """
+        # It's our own, pylint: disable=protected-access
+        graph = object.__new__(Graph)
+        graph.elements = elements
+        graph.marked = marked
+        graph.left = left
+        graph.right = right
+        graph._repr = None
+        return graph
 
     def __repr__(self):
+        # Graph patterns are never modified, so generate only once
+        if self._repr is None:
+            self._repr = self._generate_repr()
+        return self._repr
+
+    def _generate_repr(self):
+        """Generate the graph pattern's representation"""
         # It's OK, pylint: disable=too-many-branches
 
         # A list of entity IDs
@@ -319,63 +437,65 @@ class Graph:
             if element.is_complete():
                 relation_functions[element.source].append((
                     ("", "+")[self.marked.get(id, False)],
-                    element.attrs["_type"],
+                    element.type,
                     element.target
                 ))
             else:
-                element_reprs[id] += (
-                    element.attrs_repr() +
-                    (
-                        "[" +
-                        element_reprs.get(element.source, ("", ))[0] +
-                        "->" +
-                        element_reprs.get(element.target, ("", ))[0] +
-                        "]"
-                        if element.source or element.target else ""
-                    ),
-                )
+                body = element.attrs_repr()
+                if element.source or element.target:
+                    source = element_reprs.get(element.source, ("", ))[0]
+                    target = element_reprs.get(element.target, ("", ))[0]
+                    body = f"{body}[{source}->{target}]"
+                element_reprs[id] += (body,)
 
         # Generate entity and relation bodies
         for id, element in self.elements.items():
             if not isinstance(element, (Entity, Relation)):
                 continue
-            body = element.attrs_repr()
+            body_parts = [element.attrs_repr()]
             if isinstance(element, Relation):
-                functions = sorted(relation_functions[id])
+                functions = relation_functions[id]
+                functions.sort(key=itemgetter(1))
                 if any(not (n or "").isidentifier() for _, n, _ in functions):
-                    body += ":{" + ", ".join(
+                    body_parts += [":{", ", ".join(
                         f"{m}{n!r}: {element_reprs[a_id][0]}"
                         for m, n, a_id in functions
-                    ) + "}"
+                    ), "}"]
                 elif functions:
-                    body += ":(" + ", ".join(
+                    body_parts += [":(", ", ".join(
                         f"{m}{n}={element_reprs[a_id][0]}"
                         for m, n, a_id in functions
-                    ) + ")"
-            element_reprs[id] += (body,)
+                    ), ")"]
+            element_reprs[id] += ("".join(body_parts),)
 
         # Put everything together
-        return f"{element_reprs[self.left][0]} < " + ", ".join(
+        elements = ", ".join(
             ("", "+")[self.marked.get(id, False)] + "".join(element_reprs[id])
             for id in (entity_ids + relation_ids + function_ids)
-        ) + f" > {element_reprs[self.right][0]}"
+        )
+        return f"{element_reprs[self.left][0]} < {elements} " \
+            f"> {element_reprs[self.right][0]}"
 
     def to_dg(self) -> directed.Graph:
         """Convert the knowledge graph pattern to a directed graph"""
+        ids_nodes: dict[int, directed.Node] = {}
+        # A list of IDs and patterns of complete functions
+        functions: list[tuple[int, Function]] = []
+        for id, element in self.elements.items():
+            if isinstance(element, Node):
+                ids_nodes[id] = directed.Node(**element.attrs)
+            elif isinstance(element, Function) and element.is_complete():
+                functions.append((id, element))
+        # Create edges once all the nodes they could reference exist
         ids_elements: dict[int, directed.Elements] = {
-            id: directed.Node(**element.attrs)
-            for id, element in self.elements.items()
-            if isinstance(element, Node)
-        }
-        ids_elements |= {
             id: directed.Edge(
-                cast(directed.Node, ids_elements[element.source]),
-                cast(directed.Node, ids_elements[element.target]),
+                ids_nodes[element.source],
+                ids_nodes[element.target],
                 **element.attrs
             )
-            for id, element in self.elements.items()
-            if isinstance(element, Function) and element.is_complete()
+            for id, element in functions
         }
+        ids_elements |= ids_nodes
         return directed.Graph(
             elements=set(ids_elements.values()),
             marked={ids_elements[id] for id in self.marked}
@@ -390,8 +510,7 @@ class Graph:
         assert type(old) is type(new), "Cannot change element type"
         elements = self.elements.copy()
         elements[id] = new
-        gp = Graph(elements, self.marked, self.left, self.right)
-        return gp
+        return Graph._new(elements, self.marked, self.left, self.right)
 
     def overlay(self, other, *graph_ids: tuple['Graph', int]):
         """
@@ -418,7 +537,8 @@ class Graph:
             for graph_id in graph_ids
         )
 
-        next_dynamic_id = 1
+        # The generator of new dynamic (odd) IDs
+        dynamic_ids = itertools.count(1, 2)
         elements: dict[int, GraphElements] = {}
         marked: dict[int, bool] = {}
         graph_id_map: dict['Graph', dict[int, int]] = {}
@@ -426,17 +546,13 @@ class Graph:
         graph_id_map[other] = {0: 0}
 
         def overlay(graph: 'Graph'):
-            nonlocal next_dynamic_id
             id_map = graph_id_map[graph]
 
-            # Build ID map
-            for id, element in graph.elements.items():
-                if graph.is_static_id(id):
-                    new_id = id
-                else:
-                    new_id = next_dynamic_id
-                    next_dynamic_id += 2
-                id_map[id] = new_id
+            # Build ID map, keeping static IDs, and renumbering dynamic ones
+            id_map.update(
+                (id, next(dynamic_ids) if id & 1 else id)
+                for id in graph.elements
+            )
 
             # Overlay elements
             for id, element in graph.elements.items():
@@ -467,18 +583,18 @@ class Graph:
 
     def __pos__(self):
         """Mark all elements in the graph pattern"""
-        return Graph(
+        return Graph._new(
             self.elements,
-            {id: True for id in self.elements},
+            dict.fromkeys(self.elements, True),
             self.left,
             self.right
         )
 
     def __neg__(self):
         """Unmark all elements in the graph pattern"""
-        return Graph(
+        return Graph._new(
             self.elements,
-            {id: False for id in self.elements},
+            dict.fromkeys(self.elements, False),
             self.left,
             self.right
         )
@@ -486,33 +602,45 @@ class Graph:
     def __invert__(self):
         """Swap static IDs and dynamic IDs of all elements"""
         id_map = {0: 0}
-        next_dynamic_id = 1
+        dynamic_ids = itertools.count(1, 2)
+        elements: dict[int, GraphElements] = {}
+        edges: list[tuple[int, Function]] = []
 
-        # Build ID map
+        # Build ID map, moving nodes over as we go
         for id, element in self.elements.items():
-            if self.is_static_id(id):
-                id_map[id] = next_dynamic_id
-                next_dynamic_id += 2
-            else:
-                id_map[id] = Graph.__NEXT_STATIC_ID
+            # Odd IDs are dynamic, give them static ones, and vice versa
+            if id & 1:
+                new_id = Graph.__NEXT_STATIC_ID
                 Graph.__NEXT_STATIC_ID += 2
+            else:
+                new_id = next(dynamic_ids)
+            id_map[id] = new_id
+            if isinstance(element, Function):
+                edges.append((new_id, element))
+            else:
+                elements[new_id] = element
+
+        # Move edges over, once all their endpoints are mapped
+        for new_id, edge in edges:
+            elements[new_id] = edge.with_updated_endpoints(
+                id_map[edge.source], id_map[edge.target]
+            )
 
         return Graph(
-            {
-                id_map[id]:
-                element.with_updated_endpoints(
-                    id_map[element.source],
-                    id_map[element.target]
-                ) if isinstance(element, Edge) else element
-                for id, element in self.elements.items()
-            },
+            elements,
             {id_map[id]: mark for id, mark in self.marked.items()},
             id_map[self.left],
             id_map[self.right]
         )
 
     def __getattr__(self, key: str) -> 'Graph':
-        """Update the implicit attribute of the right element"""
+        """
+        Update the implicit attribute of the right element. Names starting
+        with an underscore are left to introspection (copy, IPython, etc.)
+        and raise AttributeError, use [] to specify them as values instead.
+        """
+        if key.startswith("_"):
+            raise AttributeError(key)
         return self[key]
 
     def __getitem__(self, key) -> 'Graph':
@@ -543,12 +671,12 @@ class Graph:
             isinstance(right, Graph)
 
         if isinstance(left, str):
-            left = FunctionGraph(left)
+            left = _function_graph_from_str(left)
         elif not isinstance(left, Graph):
             return NotImplemented
 
         if isinstance(right, str):
-            right = FunctionGraph(right)
+            right = _function_graph_from_str(right)
         elif not isinstance(right, Graph):
             return NotImplemented
 
@@ -602,12 +730,12 @@ class Graph:
             isinstance(right, Graph)
 
         if isinstance(left, str):
-            left = FunctionGraph(left)
+            left = _function_graph_from_str(left)
         elif not isinstance(left, Graph):
             return NotImplemented
 
         if isinstance(right, str):
-            right = FunctionGraph(right)
+            right = _function_graph_from_str(right)
         elif not isinstance(right, Graph):
             return NotImplemented
 
@@ -654,30 +782,29 @@ class Graph:
         return Graph(elements, marked, left_id, right_id)
 
     @staticmethod
-    def _shift(left, op: str, right) -> 'Graph':
-        """Create a relation or a function for a shift operator"""
+    def _shift(left, ltr: bool, right) -> 'Graph':
+        """
+        Create a relation or a function for a shift operator: ">>" if "ltr"
+        (left-to-right) is True, and "<<" if False.
+        """
         # No it's not, pylint: disable=too-many-return-statements
         # It's OK, pylint: disable=too-many-branches
-        assert op in {"<<", ">>"}
-
         if isinstance(left, str):
-            left = FunctionGraph(left)
+            left = _function_graph_from_str(left)
         elif not isinstance(left, Graph):
             return NotImplemented
 
         if isinstance(right, str):
-            right = FunctionGraph(right)
+            right = _function_graph_from_str(right)
         elif not isinstance(right, Graph):
             return NotImplemented
 
         marked = left.marked.get(left.right) or right.marked.get(right.left)
-        ltr = op == ">>"
-        left_element = left.elements[left.right]
-        left_type = next(t for t in (Entity, Relation, Function)
-                         if isinstance(left_element, t))
-        right_element = right.elements[right.left]
-        right_type = next(t for t in (Entity, Relation, Function)
-                          if isinstance(right_element, t))
+        # Graph element pattern types are never subclassed,
+        # so their exact types can be compared directly
+        left_type = type(left.elements[left.right])
+        right_type = type(right.elements[right.left])
+        assert left_type in GRAPH_ELEMENTS and right_type in GRAPH_ELEMENTS
         if ltr:
             source_type = left_type
             target_type = right_type
@@ -685,24 +812,39 @@ class Graph:
             source_type = right_type
             target_type = left_type
 
+        # Build the compound results with _fill() and _assign() directly,
+        # rather than re-dispatching through the shift operators
         if left_type in (Entity, Relation) and right_type == left_type:
             relation = RelationGraph()
             if marked:
                 relation = +relation
-            if ltr:
-                return left << "source" << relation >> "target" >> right
-            else:
-                return left << "target" << relation >> "source" >> right
+            left_function = _function_graph_from_str(
+                "source" if ltr else "target"
+            )
+            right_function = _function_graph_from_str(
+                "target" if ltr else "source"
+            )
+            # Same as left << left_function << relation >>
+            #         right_function >> right
+            return Graph._fill(
+                Graph._assign(
+                    Graph._assign(Graph._fill(left, left_function), relation),
+                    right_function
+                ),
+                right
+            )
         elif left_type == Relation and right_type == Entity:
-            function = FunctionGraph("target" if ltr else "source")
+            function = _function_graph_from_str("target" if ltr else "source")
             if marked:
                 function = +function
-            return left >> function >> right
+            # Same as left >> function >> right
+            return Graph._fill(Graph._assign(left, function), right)
         elif left_type == Entity and right_type == Relation:
-            function = FunctionGraph("source" if ltr else "target")
+            function = _function_graph_from_str("source" if ltr else "target")
             if marked:
                 function = +function
-            return left << function << right
+            # Same as left << function << right
+            return Graph._assign(Graph._fill(left, function), right)
         elif source_type == Relation and target_type == Function:
             return Graph._assign(left, right)
         elif source_type == Function and target_type in (Relation, Entity):
@@ -712,25 +854,27 @@ class Graph:
 
     def __rshift__(self, other) -> 'Graph':
         """Create a relation/function, for S >> O expression"""
-        return self._shift(self, ">>", other)
+        return self._shift(self, True, other)
 
     def __rrshift__(self, other) -> 'Graph':
         """Create a relation/function, for O >> S expression"""
-        return self._shift(other, ">>", self)
+        return self._shift(other, True, self)
 
     def __lshift__(self, other) -> 'Graph':
         """Create a relation/function, for S << O expression"""
-        return self._shift(self, "<<", other)
+        return self._shift(self, False, other)
 
     def __rlshift__(self, other) -> 'Graph':
         """Create a relation/function, for O << S expression"""
-        return self._shift(other, "<<", self)
+        return self._shift(other, False, self)
 
 
 class MetaElementGraph(type):
     """A single-element graph pattern metaclass"""
 
     def __getattr__(cls, key: str) -> Graph:
+        if key.startswith("_"):
+            raise AttributeError(key)
         return cls()[key]
 
     def __getitem__(cls, key) -> Graph:
@@ -740,10 +884,14 @@ class MetaElementGraph(type):
 class ElementGraph(Graph, metaclass=MetaElementGraph):
     """A single-element graph pattern"""
 
+    __slots__ = ()
+
 
 class EntityGraph(ElementGraph):
     """A single-entity graph pattern"""
 
+    __slots__ = ()
+
     def __init__(self, **attrs: AttrTypes):
         """
         Initialize the single-node graph pattern.
@@ -757,6 +905,8 @@ class EntityGraph(ElementGraph):
 class RelationGraph(ElementGraph):
     """A single-relation graph pattern"""
 
+    __slots__ = ()
+
     def __init__(self, **attrs: AttrTypes):
         """
         Initialize the single-relation graph pattern.
@@ -770,6 +920,8 @@ class RelationGraph(ElementGraph):
 class FunctionGraph(ElementGraph):
     """A single-function graph pattern"""
 
+    __slots__ = ()
+
     def __init__(self, type: Optional[str] = None):
         """
         Initialize the single-function graph pattern.
@@ -779,3 +931,18 @@ class FunctionGraph(ElementGraph):
         """
         fp = Function({} if type is None else dict(_type=type))
         super().__init__({1: fp}, {}, 1, 1)
+
+
+@functools.cache
+def _function_graph_from_str(type: str) -> FunctionGraph:
+    """
+    Get a single-function graph pattern for a function type name, shared
+    between all callers, as graph patterns are never modified in place.
+
+    Args:
+        type:   The function's type name.
+
+    Returns:
+        The single-function graph pattern.
+    """
+    return FunctionGraph(type)
@@ -1,4 +1,6 @@
 """Knob6 knowledge graph pattern tests."""
+from copy import copy, deepcopy
+import pickle
 import pytest
 from knob.knowledge.pattern import \
     EntityGraph as E, RelationGraph as R, FunctionGraph as F
@@ -83,6 +85,12 @@ def test_element_update(e1, r1, f1):
     assert repr(f1(_type="func")) == "f1 < f1.func > f1"
 
 
+def test_element_update_empty():
+    y = E.y
+    assert repr(y() | y) == "e1 < e1.y, e2.y > e2"
+    assert repr(y(**{}) | y) == "e1 < e1.y, e2.y > e2"
+
+
 def test_element_update_mark(e1, r1, f1):
     assert repr(+e1(x=1)) == "e1 < +e1(x=1) > e1"
     assert repr(-e1(x=1)) == "e1 < e1(x=1) > e1"
@@ -105,6 +113,23 @@ def test_element_getattr(e1, r1, f1):
         f1.state.idle
 
 
+def test_element_getattr_private(e1):
+    with pytest.raises(AttributeError):
+        e1._private
+    with pytest.raises(AttributeError):
+        e1.__wrapped__
+    with pytest.raises(AttributeError):
+        E.__wrapped__
+    assert repr(e1['_private']) == "e1 < e1._private > e1"
+    assert repr(copy(e1.x)) == "e1 < e1.x > e1"
+
+
+def test_copy_pickle(e1, e2, r1):
+    for pattern in (e1.a, r1(x=1), F.source, +e1 >> e2, e1.a >> r1 >> e2):
+        assert repr(deepcopy(pattern)) == repr(pattern)
+        assert repr(pickle.loads(pickle.dumps(pattern))) == repr(pattern)
+
+
 def test_element_getitem(e1, r1, f1):
     assert repr(e1['foo bar']) == "e1 < e1['foo bar'] > e1"
     assert repr(r1['foo bar']) == "r1 < r1['foo bar'] > r1"
@@ -246,6 +271,13 @@ def test_mark_func(r1, f1, e1):
     assert repr(r1 >> +f1.func >> e1) == "r1 < e1, r1:(+func=e1) > e1"
 
 
+def test_mark_func_order(e1, r1, e2):
+    assert repr(e1 << +F.source << r1 >> 'target' >> e2) == \
+        "e1 < e1, e2, r1:(+source=e1, target=e2) > e2"
+    assert repr(e1 << 'source' << r1 >> +F.target >> e2) == \
+        "e1 < e1, e2, r1:(source=e1, +target=e2) > e2"
+
+
 def test_refs():
     assert repr((x := ~E.x).y >> x) == \
         'e1 < e1.x.y, r1:(source=e1, target=e1) > e1'
@@ -19,11 +19,9 @@ AttrTypes = Union[str, int, bool]
 def attrs_repr(attrs: dict[str, AttrTypes]):
     """Format a (preferably compact) representation of attributes"""
     if any(not k.isidentifier() for k in attrs):
-        return "{" + ", ".join(
-            f"{k!r}: {v!r}" for k, v in attrs.items()
-        ) + "}"
+        items = ", ".join(f"{k!r}: {v!r}" for k, v in attrs.items())
+        return "{" + items + "}"
     if attrs:
-        return "(" + ", ".join(
-            f"{k}={v!r}" for k, v in attrs.items()
-        ) + ")"
+        items = ", ".join(f"{k}={v!r}" for k, v in attrs.items())
+        return f"({items})"
     return ""